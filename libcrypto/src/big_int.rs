@@ -40,16 +40,37 @@ impl<const N: usize> BigInt<N> {
     /// note: this has the same value as [`BigInt<N>::ZERO`]
     pub const MIN: Self = Self::ZERO;
 
+    /// Returns the underlying big-endian [`u64`] array
+    pub const fn into_inner(self) -> [u64; N] {
+        self.0
+    }
+
+    /// wrapping-adds `rhs` to `self`, returning the result and whether the operation
+    /// overflowed
+    pub const fn overflowing_add(self, rhs: Self) -> (Self, bool) {
+        let mut sum = [0u64; N];
+        let mut carry = false;
+        let mut i = N;
+        while i > 0 {
+            i -= 1;
+            // TODO: use libcore implementation once stabilized
+            (sum[i], carry) = carry_add(self.0[i], rhs.0[i], carry);
+        }
+        (Self(sum), carry)
+    }
+
     /// wrapping-subtracts `rhs` from `self`, returning the result and whether the operation
     /// overflowed
-    pub fn overflowing_sub(self, rhs: Self) -> (Self, bool) {
+    pub const fn overflowing_sub(self, rhs: Self) -> (Self, bool) {
         let mut diff = [0u64; N];
         let mut carry = false;
-        for i in (0..N).rev() {
+        let mut i = N;
+        while i > 0 {
+            i -= 1;
             // TODO: use libcore implementation once stabilized
-            (diff[i], carry) = carry_sub(self[i], rhs[i], carry);
+            (diff[i], carry) = carry_sub(self.0[i], rhs.0[i], carry);
         }
-        (diff.into(), carry)
+        (Self(diff), carry)
     }
 }
 
@@ -119,13 +140,7 @@ impl<const N: usize> Add for BigInt<N> {
     type Output = Self;
     /// Overflowing addition
     fn add(self, rhs: Self) -> Self::Output {
-        let mut sum = [0u64; N];
-        let mut carry = false;
-        for i in (0..N).rev() {
-            // TODO: use core implementation once stabilized
-            (sum[i], carry) = carry_add(self[i], rhs[i], carry);
-        }
-        sum.into()
+        self.overflowing_add(rhs).0
     }
 }
 
@@ -147,21 +162,92 @@ impl<const N: usize> Sub for BigInt<N> {
     }
 }
 
-impl Mul for BigInt<4> {
-    type Output = BigInt<8>;
+// TODO: make this generic over any size N once const generic expressions are stabilized
+impl BigInt<4> {
     /// Performs an expanding multiplication, meaning the output length will be double the input
     /// length
-    #[allow(clippy::suspicious_arithmetic_impl)]
-    fn mul(self, rhs: Self) -> Self::Output {
+    pub const fn widening_mul(self, rhs: Self) -> BigInt<8> {
+        // little-endian, unlike `BigInt`
         let mut product = [0u64; 8];
-        for i in 0..self.len() {
+        let mut i = 0;
+        while i < 4 {
             let mut carry = 0;
-            for j in 0..rhs.len() {
-                (product[i + j], carry) = carry_mul(self[i], rhs[j], carry);
+            let mut j = 0;
+            while j < 4 {
+                (product[i + j], carry) =
+                    carry_mul_add(self.0[3 - i], rhs.0[3 - j], product[i + j], carry);
+                j += 1;
             }
-            product[i] = carry;
+            product[i + 4] = carry;
+            i += 1;
+        }
+        let mut big_endian = [0u64; 8];
+        i = 0;
+        while i < 8 {
+            big_endian[i] = product[7 - i];
+            i += 1;
+        }
+        BigInt(big_endian)
+    }
+
+    /// Performs an expanding squaring, meaning the output length will be double the input length
+    ///
+    /// This is faster than [`widening_mul`](Self::widening_mul) because each cross product
+    /// `self[i] * self[j]` is only computed once and then doubled.
+    pub const fn widening_square(self) -> BigInt<8> {
+        let mut value = [0u64; 4];
+        let mut i = 0;
+        while i < 4 {
+            value[i] = self.0[3 - i];
+            i += 1;
+        }
+        // little-endian, unlike `BigInt`
+        let mut square = [0u64; 8];
+        i = 0;
+        while i < 3 {
+            let mut carry = 0;
+            let mut j = i + 1;
+            while j < 4 {
+                (square[i + j], carry) = carry_mul_add(value[i], value[j], square[i + j], carry);
+                j += 1;
+            }
+            square[i + 4] = carry;
+            i += 1;
+        }
+
+        i = 7;
+        while i > 0 {
+            square[i] = (square[i] << 1) | (square[i - 1] >> 63);
+            i -= 1;
+        }
+        square[0] <<= 1;
+
+        let mut carry = false;
+        i = 0;
+        while i < 4 {
+            let (low, high) = carry_mul_add(value[i], value[i], 0, 0);
+            (square[2 * i], carry) = carry_add(square[2 * i], low, carry);
+            (square[2 * i + 1], carry) = carry_add(square[2 * i + 1], high, carry);
+            i += 1;
+        }
+
+        let mut big_endian = [0u64; 8];
+        i = 0;
+        while i < 8 {
+            big_endian[i] = square[7 - i];
+            i += 1;
         }
-        product.into()
+        BigInt(big_endian)
+    }
+}
+
+impl Mul for BigInt<4> {
+    type Output = BigInt<8>;
+    /// Performs an expanding multiplication, meaning the output length will be double the input
+    /// length
+    #[allow(clippy::suspicious_arithmetic_impl)]
+    fn mul(self, rhs: Self) -> Self::Output {
+        self.widening_mul(rhs)
     }
 }
 
@@ -169,33 +255,151 @@ impl Div for BigInt<8> {
     type Output = (BigInt<4>, BigInt<4>);
     /// Returns the quotient and the remainder of the division, in that order
     ///
-    /// Warning: this operation is NOT yet constant-time
-    // TODO: make this constant-time
-    fn div(mut self, rhs: Self) -> Self::Output {
-        debug_assert!(self > rhs);
-        let mut quotient = BigInt::<4>::new([0u64; 4]);
-        while self >= rhs {
-            quotient = quotient + 1u64.into();
-            self = self - rhs;
+    /// The quotient and remainder are produced together by binary long division, which takes
+    /// the same number of steps regardless of the values of `self` and `rhs`. The quotient is
+    /// truncated to its low 256 bits.
+    ///
+    /// # Panics
+    ///
+    /// The function will panic if `rhs` is zero, or if the remainder does not fit in 256 bits.
+    /// The remainder always fits when `rhs` does.
+    fn div(self, rhs: Self) -> Self::Output {
+        assert!(rhs != Self::ZERO, "attempt to divide by zero");
+        let mut quotient = [0u64; 8];
+        let mut remainder = Self::ZERO;
+        for (i, limb) in self.iter().enumerate() {
+            for bit in (0..u64::BITS).rev() {
+                // shift the next bit of `self` into `remainder`
+                let mut carry = (limb >> bit) & 1;
+                for remainder_limb in remainder.iter_mut().rev() {
+                    let next_carry = *remainder_limb >> 63;
+                    *remainder_limb = (*remainder_limb << 1) | carry;
+                    carry = next_carry;
+                }
+                // `carry` is now the bit shifted out of `remainder`
+                let (difference, borrowed) = remainder.overflowing_sub(rhs);
+                let subtract = (carry == 1) | !borrowed;
+                let mask = (subtract as u64).wrapping_neg();
+                for (remainder_limb, difference_limb) in remainder.iter_mut().zip(difference.iter())
+                {
+                    *remainder_limb = (difference_limb & mask) | (*remainder_limb & !mask);
+                }
+                quotient[i] |= (subtract as u64) << bit;
+            }
         }
-        // we can safely unwrap because self is now guaranteed to be less than BigInt<4>::MAX
-        (quotient, self.try_into().unwrap())
+        // we can safely unwrap because the slice is guaranteed to have a length of 4
+        let quotient = BigInt::<4>::try_from(&quotient[4..]).unwrap();
+        // we can safely unwrap because remainder is now guaranteed to be less than rhs, which
+        // fits in a BigInt<4>
+        (quotient, remainder.try_into().unwrap())
     }
 }
 
-const fn carry_add(x: u64, y: u64, carry: bool) -> (u64, bool) {
+pub(crate) const fn carry_add(x: u64, y: u64, carry: bool) -> (u64, bool) {
     let (sum1, overflowed1) = x.overflowing_add(y);
     let (sum2, overflowed2) = sum1.overflowing_add(carry as u64);
     (sum2, overflowed1 || overflowed2)
 }
 
-const fn carry_mul(x: u64, y: u64, carry: u64) -> (u64, u64) {
-    let product = x as u128 * y as u128 + carry as u128;
-    (product as u64, (product >> 64) as u64)
-}
-
-const fn carry_sub(x: u64, y: u64, carry: bool) -> (u64, bool) {
+pub(crate) const fn carry_sub(x: u64, y: u64, carry: bool) -> (u64, bool) {
     let (diff1, overflowed1) = x.overflowing_sub(y);
     let (diff2, overflowed2) = diff1.overflowing_sub(carry as u64);
     (diff2, overflowed1 || overflowed2)
 }
+
+pub(crate) const fn carry_mul_add(x: u64, y: u64, z: u64, carry: u64) -> (u64, u64) {
+    // cannot overflow: (2^64 - 1)^2 + 2 * (2^64 - 1) = 2^128 - 1
+    let product = x as u128 * y as u128 + z as u128 + carry as u128;
+    (product as u64, (product >> 64) as u64)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::BigInt;
+
+    #[test]
+    fn widening_mul() {
+        let x = BigInt::new([
+            0x6b17d1f2e12c4247,
+            0xf8bce6e563a440f2,
+            0x77037d812deb33a0,
+            0xf4a13945d898c296,
+        ]);
+        let y = BigInt::new([
+            0x4fe342e2fe1a7f9b,
+            0x8ee7eb4a7c0f9e16,
+            0x2bce33576b315ece,
+            0xcbb6406837bf51f5,
+        ]);
+        let product = BigInt::new([
+            0x216b6be4374f0147,
+            0x602d8bd271ccfdf8,
+            0x755b701f75ca0ed7,
+            0x5695f1c31b2ff29e,
+            0xbfeaa3d596a84409,
+            0xce174943425656e9,
+            0x3636cd989463002a,
+            0x5568e21807adaf8e,
+        ]);
+        assert_eq!(x * y, product);
+        assert_eq!(
+            BigInt::<4>::MAX * BigInt::from(1),
+            BigInt::<8>::from(BigInt::<4>::MAX)
+        );
+    }
+
+    #[test]
+    fn widening_square() {
+        let x = BigInt::new([
+            0x6b17d1f2e12c4247,
+            0xf8bce6e563a440f2,
+            0x77037d812deb33a0,
+            0xf4a13945d898c296,
+        ]);
+        assert_eq!(x.widening_square(), x * x);
+        let max = BigInt::new([u64::MAX; 4]);
+        assert_eq!(max.widening_square(), max * max);
+    }
+
+    #[test]
+    fn div() {
+        let x = BigInt::new([
+            0x6b17d1f2e12c4247,
+            0xf8bce6e563a440f2,
+            0x77037d812deb33a0,
+            0xf4a13945d898c296,
+        ]);
+        let y = BigInt::new([
+            0x4fe342e2fe1a7f9b,
+            0x8ee7eb4a7c0f9e16,
+            0x2bce33576b315ece,
+            0xcbb6406837bf51f5,
+        ]);
+        let modulus = BigInt::new([
+            0xffffffff00000001,
+            0x0000000000000000,
+            0x00000000ffffffff,
+            0xffffffffffffffff,
+        ]);
+        let quotient = BigInt::new([
+            0x216b6be458ba6d2b,
+            0x977c8d19b08f1de6,
+            0x8e6e00ec323d85f8,
+            0xa1ab09a3f320e930,
+        ]);
+        let remainder = BigInt::new([
+            0x823cd15f6dd3c719,
+            0x33565064513a6b2b,
+            0xd183e554c6a08622,
+            0xf713ebbbface98be,
+        ]);
+        assert_eq!((x * y) / modulus.into(), (quotient, remainder));
+        assert_eq!((x * y) / (x * y), (BigInt::from(1), BigInt::ZERO));
+    }
+
+    #[test]
+    #[should_panic(expected = "attempt to divide by zero")]
+    fn div_by_zero() {
+        let _ = BigInt::<8>::from(1) / BigInt::ZERO;
+    }
+}
@@ -1,24 +1,172 @@
-use crate::big_int::BigInt;
-use core::ops::{Add, Deref, Mul, Sub};
+use crate::big_int::{carry_add, carry_mul_add, BigInt};
+use core::ops::{Add, Mul, Neg, Sub};
 
-#[derive(Debug, PartialEq, Eq, PartialOrd, Ord, Clone, Copy)]
-/// A big integer with the invariant that its value is less than its modulus
+#[derive(Debug, PartialEq, Eq, Clone, Copy)]
+/// An integer modulo [`MODULUS`](Self::MODULUS)
+///
+/// Internally, the value is stored in Montgomery form (`value * R mod MODULUS`, where `R = 2^256`)
+/// so that modular multiplication does not require any division.
 pub struct FieldElement(BigInt<4>);
 
 impl FieldElement {
-    pub const MODULUS: Self = Self(BigInt::new([
-        0xffffffff00000000,
+    /// The prime modulus of the field: `2^256 - 2^224 + 2^192 + 2^96 - 1`
+    pub const MODULUS: BigInt<4> = BigInt::new([
+        0xffffffff00000001,
+        0x0000000000000000,
+        0x00000000ffffffff,
         0xffffffffffffffff,
-        0xbce6faada7179e84,
-        0xf3b9cac2fc632551,
-    ]));
+    ]);
+
+    /// `R^2 mod MODULUS`, used to convert values into Montgomery form
+    const R_SQUARED: BigInt<4> = BigInt::new([
+        0x00000004fffffffd,
+        0xfffffffffffffffe,
+        0xfffffffbffffffff,
+        0x0000000000000003,
+    ]);
+
+    /// `-MODULUS^-1 mod 2^64`
+    const MOD_INV_NEG: u64 = mod_inv_neg(Self::MODULUS.into_inner()[3]);
+
+    /// The additive identity
+    pub const ZERO: Self = Self(BigInt::ZERO);
+
+    /// The multiplicative identity
+    pub const ONE: Self = Self::new(BigInt::new([0, 0, 0, 1]));
+
+    /// Constructs a new `FieldElement` from `value`, reducing it modulo
+    /// [`MODULUS`](Self::MODULUS)
+    pub const fn new(value: BigInt<4>) -> Self {
+        // `MODULUS` is greater than 2^255, so a single subtraction fully reduces any 256-bit value
+        let value = reduce_once(value.into_inner(), false);
+        Self(BigInt::new(mont_mul(&value, &Self::R_SQUARED.into_inner())))
+    }
+
+    /// Returns the value of `self` as a [`BigInt`], converted out of Montgomery form
+    pub const fn into_big_int(self) -> BigInt<4> {
+        BigInt::new(mont_mul(&self.0.into_inner(), &[0, 0, 0, 1]))
+    }
+
+    /// Returns whether the internal representation of `self` is less than
+    /// [`MODULUS`](Self::MODULUS)
+    ///
+    /// This invariant is upheld by every constructor and operation, so it is only checked in
+    /// debug builds.
+    const fn is_reduced(self) -> bool {
+        self.0.overflowing_sub(Self::MODULUS).1
+    }
+
+    /// Returns whether `self` and `other` are equal, for use in const contexts
+    const fn const_eq(self, other: Self) -> bool {
+        let (lhs, rhs) = (self.0.into_inner(), other.0.into_inner());
+        lhs[0] == rhs[0] && lhs[1] == rhs[1] && lhs[2] == rhs[2] && lhs[3] == rhs[3]
+    }
+
+    /// Returns whether `self` is zero, without branching
+    const fn is_zero(self) -> bool {
+        let value = self.0.into_inner();
+        (value[0] | value[1] | value[2] | value[3]) == 0
+    }
+
+    /// Performs constant-time addition modulo [`MODULUS`](Self::MODULUS)
+    pub const fn add(self, rhs: Self) -> Self {
+        debug_assert!(self.is_reduced() && rhs.is_reduced());
+        let (sum, carry) = self.0.overflowing_add(rhs.0);
+        Self(BigInt::new(reduce_once(sum.into_inner(), carry)))
+    }
+
+    /// Performs constant-time doubling modulo [`MODULUS`](Self::MODULUS)
+    ///
+    /// This is a one-bit shift, which is cheaper than adding `self` to itself.
+    pub const fn double(self) -> Self {
+        debug_assert!(self.is_reduced());
+        let value = self.0.into_inner();
+        let mut doubled = [0u64; 4];
+        let mut i = 0;
+        while i < 3 {
+            doubled[i] = (value[i] << 1) | (value[i + 1] >> 63);
+            i += 1;
+        }
+        doubled[3] = value[3] << 1;
+        Self(BigInt::new(reduce_once(doubled, value[0] >> 63 == 1)))
+    }
+
+    /// Performs constant-time subtraction modulo [`MODULUS`](Self::MODULUS)
+    pub const fn sub(self, rhs: Self) -> Self {
+        debug_assert!(self.is_reduced() && rhs.is_reduced());
+        let (difference, borrow) = self.0.overflowing_sub(rhs.0);
+        let correction = select(&Self::MODULUS.into_inner(), &[0; 4], borrow);
+        Self(difference.overflowing_add(BigInt::new(correction)).0)
+    }
+
+    /// Performs constant-time negation modulo [`MODULUS`](Self::MODULUS)
+    pub const fn neg(self) -> Self {
+        debug_assert!(self.is_reduced());
+        let (difference, _) = Self::MODULUS.overflowing_sub(self.0);
+        // `MODULUS - 0` is not reduced, so zero must map to itself
+        Self(BigInt::new(select(
+            &[0; 4],
+            &difference.into_inner(),
+            self.is_zero(),
+        )))
+    }
+
+    /// Performs constant-time multiplication modulo [`MODULUS`](Self::MODULUS)
+    pub const fn mul(self, rhs: Self) -> Self {
+        debug_assert!(self.is_reduced() && rhs.is_reduced());
+        Self(BigInt::new(mont_mul(
+            &self.0.into_inner(),
+            &rhs.0.into_inner(),
+        )))
+    }
+
+    /// Performs constant-time squaring modulo [`MODULUS`](Self::MODULUS)
+    pub const fn square(self) -> Self {
+        debug_assert!(self.is_reduced());
+        Self(BigInt::new(mont_reduce(
+            &self.0.widening_square().into_inner(),
+        )))
+    }
+
+    /// Squares `self` `n` times
+    const fn square_n(self, n: u32) -> Self {
+        let mut result = self;
+        let mut i = 0;
+        while i < n {
+            result = result.square();
+            i += 1;
+        }
+        result
+    }
+
+    /// Returns the multiplicative inverse of `self`, or zero if `self` is zero
+    ///
+    /// By Fermat's little theorem, `self^(MODULUS - 2)` is the inverse of `self`. The exponent
+    /// is computed with a fixed addition chain of 255 squarings and 12 multiplications.
+    pub const fn inverse(self) -> Self {
+        // x_n = self^(2^n - 1)
+        let x_2 = self.square().mul(self);
+        let x_3 = x_2.square().mul(self);
+        let x_6 = x_3.square_n(3).mul(x_3);
+        let x_12 = x_6.square_n(6).mul(x_6);
+        let x_15 = x_12.square_n(3).mul(x_3);
+        let x_30 = x_15.square_n(15).mul(x_15);
+        let x_32 = x_30.square_n(2).mul(x_2);
+
+        // MODULUS - 2 = ffffffff 00000001 00000000 00000000 00000000 ffffffff ffffffff fffffffd
+        let result = x_32.square_n(32).mul(self);
+        let result = result.square_n(128).mul(x_32);
+        let result = result.square_n(32).mul(x_32);
+        let result = result.square_n(30).mul(x_30);
+        result.square_n(2).mul(self)
+    }
 }
 
 impl Add for FieldElement {
     type Output = Self;
     /// Performs constant-time addition modulo [`MODULUS`](Self::MODULUS)
     fn add(self, rhs: Self) -> Self::Output {
-        Self(self.0 + rhs.0) - Self::MODULUS
+        FieldElement::add(self, rhs)
     }
 }
 
@@ -26,20 +174,791 @@ impl Sub for FieldElement {
     type Output = Self;
     /// Performs constant-time subtraction modulo [`MODULUS`](Self::MODULUS)
     fn sub(self, rhs: Self) -> Self::Output {
-        let (difference, carry) = self.0.overflowing_sub(rhs.0);
-        Self(difference + Self::MODULUS.0 * carry)
-        // todo!()
+        FieldElement::sub(self, rhs)
+    }
+}
+
+impl Neg for FieldElement {
+    type Output = Self;
+    /// Performs constant-time negation modulo [`MODULUS`](Self::MODULUS)
+    fn neg(self) -> Self::Output {
+        FieldElement::neg(self)
     }
 }
 
-// TODO: use montgomery field for more efficient modular multiplication
 impl Mul for FieldElement {
     type Output = Self;
-    /// Performs subtraction modulo [`MODULUS`](Self::MODULUS)
-    ///
-    // TODO: fix this doc link
-    /// WARNING: because [`BigInt::div`](crate::big_int::BigInt::div) is not yet constant-time, neither is this operation
+    /// Performs constant-time multiplication modulo [`MODULUS`](Self::MODULUS)
     fn mul(self, rhs: Self) -> Self::Output {
-        Self(((self.0 * rhs.0) / Self::MODULUS.0.into()).1)
+        FieldElement::mul(self, rhs)
+    }
+}
+
+/// The coefficient `a` of the curve equation `y^2 = x^3 + ax + b`
+pub const A: FieldElement = FieldElement::new(BigInt::new([
+    0xffffffff00000001,
+    0x0000000000000000,
+    0x00000000ffffffff,
+    0xfffffffffffffffc,
+]));
+
+/// The coefficient `b` of the curve equation `y^2 = x^3 + ax + b`
+pub const B: FieldElement = FieldElement::new(BigInt::new([
+    0x5ac635d8aa3a93e7,
+    0xb3ebbd55769886bc,
+    0x651d06b0cc53b0f6,
+    0x3bce3c3e27d2604b,
+]));
+
+/// Inverts every element of `elements` using a single call to
+/// [`FieldElement::inverse`] (Montgomery's trick)
+///
+/// Like [`FieldElement::inverse`], zero is inverted to zero. Zero elements do not affect the
+/// inverses of the other elements.
+pub const fn batch_invert<const N: usize>(elements: &[FieldElement; N]) -> [FieldElement; N] {
+    // a single zero would zero out the whole product, so zeros are swapped for one
+    let mut nonzero = [FieldElement::ONE; N];
+    // inverses[i] starts as the product of every element before nonzero[i]
+    let mut inverses = [FieldElement::ZERO; N];
+    let mut product = FieldElement::ONE;
+    let mut i = 0;
+    while i < N {
+        nonzero[i] = FieldElement(BigInt::new(select(
+            &FieldElement::ONE.0.into_inner(),
+            &elements[i].0.into_inner(),
+            elements[i].is_zero(),
+        )));
+        inverses[i] = product;
+        product = product.mul(nonzero[i]);
+        i += 1;
+    }
+    // always the inverse of the product of nonzero[..i]
+    let mut inverse = product.inverse();
+    while i > 0 {
+        i -= 1;
+        inverses[i] = FieldElement(BigInt::new(select(
+            &[0; 4],
+            &inverses[i].mul(inverse).0.into_inner(),
+            elements[i].is_zero(),
+        )));
+        inverse = inverse.mul(nonzero[i]);
+    }
+    inverses
+}
+
+#[derive(Debug, PartialEq, Eq, Clone, Copy)]
+/// A point on the curve in affine coordinates `(x, y)`
+pub struct AffinePoint {
+    x: FieldElement,
+    y: FieldElement,
+}
+
+impl AffinePoint {
+    /// The point at infinity, which is the additive identity
+    ///
+    /// `(0, 0)` is not on the curve, so it is used to represent the point at infinity.
+    pub const IDENTITY: Self = Self::new(FieldElement::ZERO, FieldElement::ZERO);
+
+    /// Constructs a new `AffinePoint` from its coordinates
+    ///
+    /// The point is not checked to be on the curve.
+    pub const fn new(x: FieldElement, y: FieldElement) -> Self {
+        Self { x, y }
+    }
+
+    /// Returns the x-coordinate of `self`
+    ///
+    /// The point at infinity has no coordinates and reads as `(0, 0)`. Use
+    /// [`is_identity`](Self::is_identity) to tell it apart from a point on the curve.
+    pub const fn x(&self) -> FieldElement {
+        self.x
+    }
+
+    /// Returns the y-coordinate of `self`
+    ///
+    /// The point at infinity has no coordinates and reads as `(0, 0)`. Use
+    /// [`is_identity`](Self::is_identity) to tell it apart from a point on the curve.
+    pub const fn y(&self) -> FieldElement {
+        self.y
+    }
+
+    /// Returns whether `self` is the point at infinity
+    pub const fn is_identity(&self) -> bool {
+        self.x.const_eq(FieldElement::ZERO) && self.y.const_eq(FieldElement::ZERO)
+    }
+
+    /// Returns the additive inverse of `self`
+    pub const fn neg(self) -> Self {
+        Self::new(self.x, self.y.neg())
+    }
+
+    /// Converts `self` into Jacobian coordinates
+    pub const fn as_jacobian(self) -> JacobianPoint {
+        if self.is_identity() {
+            return JacobianPoint::IDENTITY;
+        }
+        JacobianPoint::new(self.x, self.y, FieldElement::ONE)
+    }
+
+    /// Adds `self` and `rhs`
+    ///
+    /// When adding many points, prefer converting to [`JacobianPoint`] and only converting
+    /// back at the end: each call to this function performs a field inversion.
+    ///
+    /// WARNING: this operation is not constant-time: it branches when either point is the
+    /// point at infinity and when `rhs` is `self` or `-self`
+    pub const fn add(self, rhs: Self) -> Self {
+        if self.is_identity() {
+            return rhs;
+        }
+        if rhs.is_identity() {
+            return self;
+        }
+        // if the x-coordinates match, `rhs` is either `self` or `-self`
+        if self.x.const_eq(rhs.x) {
+            if self.y.add(rhs.y).const_eq(FieldElement::ZERO) {
+                return Self::IDENTITY;
+            }
+            return self.double();
+        }
+        self.as_jacobian().add_affine(rhs).as_affine()
+    }
+
+    /// Adds `self` to itself
+    pub const fn double(self) -> Self {
+        self.as_jacobian().double().as_affine()
+    }
+
+    /// Multiplies `self` by `scalar`
+    ///
+    /// WARNING: this operation is not constant-time with respect to `scalar`
+    pub const fn mul_scalar(self, scalar: BigInt<4>) -> Self {
+        let scalar = scalar.into_inner();
+        let mut product = JacobianPoint::IDENTITY;
+        let mut i = 0;
+        while i < 4 {
+            let mut bit = u64::BITS;
+            while bit > 0 {
+                bit -= 1;
+                product = product.double();
+                if (scalar[i] >> bit) & 1 == 1 {
+                    product = product.add_affine(self);
+                }
+            }
+            i += 1;
+        }
+        product.as_affine()
+    }
+}
+
+/// The generator point of the curve
+pub const BASE_POINT: AffinePoint = AffinePoint::new(
+    FieldElement::new(BigInt::new([
+        0x6b17d1f2e12c4247,
+        0xf8bce6e563a440f2,
+        0x77037d812deb33a0,
+        0xf4a13945d898c296,
+    ])),
+    FieldElement::new(BigInt::new([
+        0x4fe342e2fe1a7f9b,
+        0x8ee7eb4a7c0f9e16,
+        0x2bce33576b315ece,
+        0xcbb6406837bf51f5,
+    ])),
+);
+
+#[derive(Debug, Clone, Copy)]
+/// A point on the curve in Jacobian coordinates `(X, Y, Z)`, representing the affine point
+/// `(X / Z^2, Y / Z^3)`
+///
+/// Jacobian coordinates avoid a field inversion on every addition and allow cheaper doubling
+/// than standard projective coordinates.
+pub struct JacobianPoint {
+    x: FieldElement,
+    y: FieldElement,
+    z: FieldElement,
+}
+
+impl JacobianPoint {
+    /// The point at infinity, which is the additive identity
+    pub const IDENTITY: Self = Self::new(FieldElement::ONE, FieldElement::ONE, FieldElement::ZERO);
+
+    /// Constructs a new `JacobianPoint` from its coordinates
+    pub const fn new(x: FieldElement, y: FieldElement, z: FieldElement) -> Self {
+        Self { x, y, z }
+    }
+
+    /// Returns whether `self` is the point at infinity
+    pub const fn is_identity(&self) -> bool {
+        self.z.const_eq(FieldElement::ZERO)
+    }
+
+    /// Converts `self` into affine coordinates, using a single field inversion
+    ///
+    /// The point at infinity is converted into [`AffinePoint::IDENTITY`], because zero's inverse
+    /// is computed as zero.
+    pub const fn as_affine(self) -> AffinePoint {
+        self.as_affine_with(self.z.inverse())
+    }
+
+    /// Converts `self` into affine coordinates, given the inverse of its Z-coordinate
+    const fn as_affine_with(self, z_inverse: FieldElement) -> AffinePoint {
+        let z_inverse_sqr = z_inverse.square();
+        AffinePoint::new(
+            self.x.mul(z_inverse_sqr),
+            self.y.mul(z_inverse_sqr.mul(z_inverse)),
+        )
+    }
+
+    /// Adds `self` and `rhs`
+    ///
+    /// WARNING: this operation is not constant-time: it branches when either point is the
+    /// point at infinity and when `rhs` is `self` or `-self`
+    pub const fn add(self, rhs: Self) -> Self {
+        if self.is_identity() {
+            return rhs;
+        }
+        if rhs.is_identity() {
+            return self;
+        }
+        let z_1_sqr = self.z.square();
+        let z_2_sqr = rhs.z.square();
+        let u_1 = self.x.mul(z_2_sqr);
+        let u_2 = rhs.x.mul(z_1_sqr);
+        let s_1 = self.y.mul(z_2_sqr.mul(rhs.z));
+        let s_2 = rhs.y.mul(z_1_sqr.mul(self.z));
+        let h = u_2.sub(u_1);
+        let r = s_2.sub(s_1);
+        // the general formula degenerates when both points share an affine x-coordinate
+        if h.const_eq(FieldElement::ZERO) {
+            if r.const_eq(FieldElement::ZERO) {
+                return self.double();
+            }
+            return Self::IDENTITY;
+        }
+
+        let h_sqr = h.square();
+        let h_cube = h_sqr.mul(h);
+        let u_1_h_sqr = u_1.mul(h_sqr);
+
+        let x = r.square().sub(h_cube).sub(u_1_h_sqr.double());
+        let y = r.mul(u_1_h_sqr.sub(x)).sub(s_1.mul(h_cube));
+        let z = self.z.mul(rhs.z).mul(h);
+        Self::new(x, y, z)
+    }
+
+    /// Adds `self` and `rhs`
+    ///
+    /// This is cheaper than [`add`](Self::add) because `rhs` has an implicit Z-coordinate of one.
+    ///
+    /// WARNING: this operation is not constant-time: it branches when either point is the point
+    /// at infinity and when `rhs` is `self` or `-self`
+    pub const fn add_affine(self, rhs: AffinePoint) -> Self {
+        if self.is_identity() {
+            return rhs.as_jacobian();
+        }
+        if rhs.is_identity() {
+            return self;
+        }
+        let z_1_sqr = self.z.square();
+        let u_2 = rhs.x.mul(z_1_sqr);
+        let s_2 = rhs.y.mul(self.z.mul(z_1_sqr));
+        let h = u_2.sub(self.x);
+        let s_2_minus_y_1 = s_2.sub(self.y);
+        // the general formula degenerates when both points share an affine x-coordinate
+        if h.const_eq(FieldElement::ZERO) {
+            if s_2_minus_y_1.const_eq(FieldElement::ZERO) {
+                return self.double();
+            }
+            return Self::IDENTITY;
+        }
+
+        let h_sqr = h.square();
+        let i = h_sqr.double().double();
+        let j = h.mul(i);
+        let r = s_2_minus_y_1.double();
+        let v = self.x.mul(i);
+
+        let x = r.square().sub(j).sub(v.double());
+        let y = r.mul(v.sub(x)).sub(self.y.mul(j).double());
+        let z = self.z.add(h).square().sub(z_1_sqr).sub(h_sqr);
+        Self::new(x, y, z)
+    }
+
+    /// Adds `self` to itself
+    ///
+    /// This relies on [`A`] being `-3`, which allows `3X^2 + aZ^4` to be computed as
+    /// `3(X - Z^2)(X + Z^2)`.
+    pub const fn double(self) -> Self {
+        let z_sqr = self.z.square();
+        let y_sqr = self.y.square();
+        let x_minus_z_sqr = self.x.sub(z_sqr);
+        let m = x_minus_z_sqr.mul(self.x.add(z_sqr));
+        let m = m.double().add(m);
+
+        let s = self.x.mul(y_sqr).double().double();
+
+        let x = m.square().sub(s.double());
+        let y_4th_8 = y_sqr.square().double().double().double();
+        let y = m.mul(s.sub(x)).sub(y_4th_8);
+        let z = self.y.mul(self.z).double();
+        Self::new(x, y, z)
+    }
+}
+
+/// Converts every point in `points` into affine coordinates using a single field inversion
+///
+/// This uses [`batch_invert`], trading `N - 1` inversions for `3(N - 1)` multiplications.
+/// Like [`JacobianPoint::as_affine`], the point at infinity is converted into
+/// [`AffinePoint::IDENTITY`].
+pub const fn batch_to_affine<const N: usize>(points: &[JacobianPoint; N]) -> [AffinePoint; N] {
+    let mut z = [FieldElement::ZERO; N];
+    let mut i = 0;
+    while i < N {
+        z[i] = points[i].z;
+        i += 1;
+    }
+    let z_inverse = batch_invert(&z);
+
+    let mut affine = [AffinePoint::IDENTITY; N];
+    i = 0;
+    while i < N {
+        affine[i] = points[i].as_affine_with(z_inverse[i]);
+        i += 1;
+    }
+    affine
+}
+
+/// The number of bits in each slice ("tooth spacing") of a scalar multiplied by [`mul_base`]
+const COMB_SPACING: u32 = 16;
+
+/// The number of slices combined into a single [`COMB_TABLE`] lookup
+const COMB_TEETH: usize = 4;
+
+/// The number of lookup tables in [`COMB_TABLE`]
+const COMB_TABLES: usize = 256 / (COMB_SPACING as usize * COMB_TEETH);
+
+/// Precomputed multiples of [`BASE_POINT`] for [`mul_base`]
+///
+/// Entry `v - 1` of table `t` is the sum of `2^(COMB_SPACING * (COMB_TEETH * t + i)) * G` over
+/// every bit `i` set in `v`.
+static COMB_TABLE: [[AffinePoint; (1 << COMB_TEETH) - 1]; COMB_TABLES] = comb_table();
+
+/// Computes [`COMB_TABLE`]
+const fn comb_table() -> [[AffinePoint; (1 << COMB_TEETH) - 1]; COMB_TABLES] {
+    const SIZE: usize = (1 << COMB_TEETH) - 1;
+
+    // tooth i is 2^(COMB_SPACING * i) * G
+    let mut teeth = [BASE_POINT.as_jacobian(); COMB_TABLES * COMB_TEETH];
+    let mut i = 1;
+    while i < teeth.len() {
+        teeth[i] = teeth[i - 1];
+        let mut j = 0;
+        while j < COMB_SPACING {
+            teeth[i] = teeth[i].double();
+            j += 1;
+        }
+        i += 1;
+    }
+
+    let mut points = [JacobianPoint::IDENTITY; COMB_TABLES * SIZE];
+    let mut table = 0;
+    while table < COMB_TABLES {
+        let mut value = 1;
+        while value <= SIZE {
+            // add the highest tooth in `value` to the entry for the remaining teeth
+            let highest = usize::BITS - 1 - value.leading_zeros();
+            let tooth = teeth[COMB_TEETH * table + highest as usize];
+            let rest = value ^ (1 << highest);
+            points[table * SIZE + value - 1] = if rest == 0 {
+                tooth
+            } else {
+                points[table * SIZE + rest - 1].add(tooth)
+            };
+            value += 1;
+        }
+        table += 1;
+    }
+
+    let points = batch_to_affine(&points);
+    let mut tables = [[AffinePoint::IDENTITY; SIZE]; COMB_TABLES];
+    i = 0;
+    while i < points.len() {
+        tables[i / SIZE][i % SIZE] = points[i];
+        i += 1;
+    }
+    tables
+}
+
+/// Multiplies [`BASE_POINT`] by `scalar`
+///
+/// This is much faster than [`AffinePoint::mul_scalar`]: it uses a table of multiples of
+/// [`BASE_POINT`] precomputed at compile time (the Lim-Lee comb method), needing only 16
+/// doublings and at most 64 additions.
+///
+/// WARNING: this operation is not constant-time with respect to `scalar`
+pub fn mul_base(scalar: BigInt<4>) -> AffinePoint {
+    let scalar = scalar.into_inner();
+    let bit = |index: u32| (scalar[3 - index as usize / 64] >> (index % 64)) & 1;
+
+    let mut product = JacobianPoint::IDENTITY;
+    for offset in (0..COMB_SPACING).rev() {
+        product = product.double();
+        for (table_index, table) in COMB_TABLE.iter().enumerate() {
+            let mut value = 0;
+            for tooth in 0..COMB_TEETH {
+                let slice = (COMB_TEETH * table_index + tooth) as u32;
+                value |= (bit(COMB_SPACING * slice + offset) as usize) << tooth;
+            }
+            if value != 0 {
+                product = product.add_affine(table[value - 1]);
+            }
+        }
+    }
+    product.as_affine()
+}
+
+/// Computes `-n^-1 mod 2^64` for an odd `n` using Newton's method
+const fn mod_inv_neg(n: u64) -> u64 {
+    // correct to 1 bit; each iteration doubles the number of correct bits
+    let mut inverse = 1u64;
+    let mut i = 0;
+    while i < 6 {
+        inverse = inverse.wrapping_mul(2u64.wrapping_sub(n.wrapping_mul(inverse)));
+        i += 1;
+    }
+    inverse.wrapping_neg()
+}
+
+/// Returns `a` if `choice` is true, otherwise `b`, without branching
+const fn select(a: &[u64; 4], b: &[u64; 4], choice: bool) -> [u64; 4] {
+    let mask = (choice as u64).wrapping_neg();
+    let mut selected = [0u64; 4];
+    let mut i = 0;
+    while i < 4 {
+        selected[i] = (a[i] & mask) | (b[i] & !mask);
+        i += 1;
+    }
+    selected
+}
+
+/// Subtracts [`MODULUS`](FieldElement::MODULUS) from `value` if `value` is not already reduced
+///
+/// `carry` is the 257th bit of `value`. `value` must be less than `2 * MODULUS`.
+const fn reduce_once(value: [u64; 4], carry: bool) -> [u64; 4] {
+    let (difference, borrow) = BigInt::new(value).overflowing_sub(FieldElement::MODULUS);
+    select(&difference.into_inner(), &value, carry | !borrow)
+}
+
+/// Computes `a * b * R^-1 mod MODULUS`
+const fn mont_mul(a: &[u64; 4], b: &[u64; 4]) -> [u64; 4] {
+    let product = BigInt::new(*a).widening_mul(BigInt::new(*b));
+    mont_reduce(&product.into_inner())
+}
+
+/// Computes `value * R^-1 mod MODULUS` using Montgomery reduction
+///
+/// `value` must be less than `MODULUS * R`.
+const fn mont_reduce(value: &[u64; 8]) -> [u64; 4] {
+    let modulus = FieldElement::MODULUS.into_inner();
+    // little-endian, unlike `value`
+    let mut t = [0u64; 8];
+    let mut i = 0;
+    while i < 8 {
+        t[i] = value[7 - i];
+        i += 1;
+    }
+    // carries out of the top limb are deferred to the next iteration
+    let mut overflowed = false;
+    i = 0;
+    while i < 4 {
+        // adding `m * MODULUS` makes limb `i` zero
+        let m = t[i].wrapping_mul(FieldElement::MOD_INV_NEG);
+        let mut carry = 0;
+        let mut j = 0;
+        while j < 4 {
+            (t[i + j], carry) = carry_mul_add(m, modulus[3 - j], t[i + j], carry);
+            j += 1;
+        }
+        (t[i + 4], overflowed) = carry_add(t[i + 4], carry, overflowed);
+        i += 1;
+    }
+    reduce_once([t[7], t[6], t[5], t[4]], overflowed)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{
+        batch_invert, batch_to_affine, mul_base, AffinePoint, FieldElement, JacobianPoint,
+        BASE_POINT,
+    };
+    use crate::big_int::BigInt;
+
+    const X: BigInt<4> = BigInt::new([
+        0x6b17d1f2e12c4247,
+        0xf8bce6e563a440f2,
+        0x77037d812deb33a0,
+        0xf4a13945d898c296,
+    ]);
+
+    const Y: BigInt<4> = BigInt::new([
+        0x4fe342e2fe1a7f9b,
+        0x8ee7eb4a7c0f9e16,
+        0x2bce33576b315ece,
+        0xcbb6406837bf51f5,
+    ]);
+
+    #[test]
+    fn montgomery_form() {
+        assert_eq!(FieldElement::new(X).into_big_int(), X);
+        assert_eq!(FieldElement::new(FieldElement::MODULUS), FieldElement::ZERO);
+        assert_eq!(FieldElement::ONE.into_big_int(), BigInt::new([0, 0, 0, 1]));
+    }
+
+    #[test]
+    fn add() {
+        let sum = BigInt::new([
+            0xbafb14d5df46c1e3,
+            0x87a4d22fdfb3df08,
+            0xa2d1b0d8991c926f,
+            0xc05779ae1058148b,
+        ]);
+        assert_eq!(
+            (FieldElement::new(X) + FieldElement::new(Y)).into_big_int(),
+            sum
+        );
+        let max = FieldElement::ZERO - FieldElement::ONE;
+        assert_eq!(max + FieldElement::ONE, FieldElement::ZERO);
+    }
+
+    #[test]
+    fn double() {
+        let x = FieldElement::new(X);
+        assert_eq!(x.double(), x + x);
+        let max = FieldElement::ZERO - FieldElement::ONE;
+        assert_eq!(max.double(), max + max);
+    }
+
+    #[test]
+    fn neg() {
+        let x = FieldElement::new(X);
+        assert_eq!(-x + x, FieldElement::ZERO);
+        assert_eq!(-x, FieldElement::ZERO - x);
+        assert_eq!(-FieldElement::ZERO, FieldElement::ZERO);
+    }
+
+    #[test]
+    fn sub() {
+        let difference = BigInt::new([
+            0x1b348f0fe311c2ac,
+            0x69d4fb9ae794a2dc,
+            0x4b354a29c2b9d4d2,
+            0x28eaf8dda0d970a1,
+        ]);
+        assert_eq!(
+            (FieldElement::new(X) - FieldElement::new(Y)).into_big_int(),
+            difference
+        );
+        let difference = BigInt::new([
+            0xe4cb70ef1cee3d54,
+            0x962b0465186b5d23,
+            0xb4cab5d73d462b2d,
+            0xd71507225f268f5e,
+        ]);
+        assert_eq!(
+            (FieldElement::new(Y) - FieldElement::new(X)).into_big_int(),
+            difference
+        );
+    }
+
+    #[test]
+    fn mul() {
+        let product = BigInt::new([
+            0x823cd15f6dd3c719,
+            0x33565064513a6b2b,
+            0xd183e554c6a08622,
+            0xf713ebbbface98be,
+        ]);
+        assert_eq!(
+            (FieldElement::new(X) * FieldElement::new(Y)).into_big_int(),
+            product
+        );
+        let square = BigInt::new([
+            0x98f6b84d29bef2b2,
+            0x81819a5e0e3690d8,
+            0x33b699495d694dd1,
+            0x002ae56c426b3f8c,
+        ]);
+        assert_eq!(FieldElement::new(X).square().into_big_int(), square);
+    }
+
+    #[test]
+    fn inverse() {
+        let x = FieldElement::new(X);
+        assert_eq!(x.inverse() * x, FieldElement::ONE);
+        assert_eq!(FieldElement::ZERO.inverse(), FieldElement::ZERO);
+    }
+
+    #[test]
+    fn batch_inverse() {
+        let elements = [
+            FieldElement::new(X),
+            FieldElement::new(Y),
+            FieldElement::ONE,
+            FieldElement::ZERO,
+        ];
+        let inverses = batch_invert(&elements);
+        for (element, inverse) in elements.into_iter().zip(inverses) {
+            assert_eq!(element.inverse(), inverse);
+        }
+    }
+
+    fn point(x: [u64; 4], y: [u64; 4]) -> AffinePoint {
+        AffinePoint::new(
+            FieldElement::new(BigInt::new(x)),
+            FieldElement::new(BigInt::new(y)),
+        )
+    }
+
+    #[test]
+    fn point_arithmetic() {
+        let double = point(
+            [
+                0x7cf27b188d034f7e,
+                0x8a52380304b51ac3,
+                0xc08969e277f21b35,
+                0xa60b48fc47669978,
+            ],
+            [
+                0x07775510db8ed040,
+                0x293d9ac69f7430db,
+                0xba7dade63ce98229,
+                0x9e04b79d227873d1,
+            ],
+        );
+        let triple = point(
+            [
+                0x5ecbe4d1a6330a44,
+                0xc8f7ef951d4bf165,
+                0xe6c6b721efada985,
+                0xfb41661bc6e7fd6c,
+            ],
+            [
+                0x8734640c4998ff7e,
+                0x374b06ce1a64a2ec,
+                0xd82ab036384fb83d,
+                0x9a79b127a27d5032,
+            ],
+        );
+        assert_eq!(BASE_POINT.double(), double);
+        assert_eq!(BASE_POINT.add(BASE_POINT), double);
+        assert_eq!(double.add(BASE_POINT), triple);
+        assert_eq!(BASE_POINT.add(BASE_POINT.neg()), AffinePoint::IDENTITY);
+        assert_eq!(BASE_POINT.add(AffinePoint::IDENTITY), BASE_POINT);
+        assert_eq!(AffinePoint::IDENTITY.add(BASE_POINT), BASE_POINT);
+        assert_eq!(AffinePoint::IDENTITY.double(), AffinePoint::IDENTITY);
+    }
+
+    #[test]
+    fn jacobian_exceptional_cases() {
+        let point = BASE_POINT.as_jacobian().double();
+        assert_eq!(point.add(point).as_affine(), point.double().as_affine());
+        assert!(point
+            .add(point.as_affine().neg().as_jacobian())
+            .is_identity());
+        assert_eq!(
+            JacobianPoint::IDENTITY.add(point).as_affine(),
+            point.as_affine()
+        );
+        assert_eq!(
+            point.add(JacobianPoint::IDENTITY).as_affine(),
+            point.as_affine()
+        );
+        assert!(JacobianPoint::IDENTITY.double().is_identity());
+        let affine = point.as_affine();
+        assert_eq!(
+            point.add_affine(affine).as_affine(),
+            point.double().as_affine()
+        );
+        assert!(point.add_affine(affine.neg()).is_identity());
+        assert_eq!(
+            JacobianPoint::IDENTITY.add_affine(affine).as_affine(),
+            affine
+        );
+        assert_eq!(point.add_affine(AffinePoint::IDENTITY).as_affine(), affine);
+        assert_eq!(JacobianPoint::IDENTITY.as_affine(), AffinePoint::IDENTITY);
+        assert_eq!(
+            point.add_affine(BASE_POINT).as_affine(),
+            point.add(BASE_POINT.as_jacobian()).as_affine()
+        );
+    }
+
+    #[test]
+    fn mul_scalar() {
+        let scalar = BigInt::new([
+            0x0123456789abcdef,
+            0xfedcba9876543210,
+            0x0f1e2d3c4b5a6978,
+            0x8796a5b4c3d2e1f0,
+        ]);
+        let product = point(
+            [
+                0xbab47346ed163f06,
+                0x1ac6d2191c3deea7,
+                0xbd5070ca32f92965,
+                0x6837d6ba05d64b27,
+            ],
+            [
+                0xc14cf0f1f6041d29,
+                0xee085d4a6a2b9df4,
+                0x665a45cdb50ec7db,
+                0xf89f6130b49c8aed,
+            ],
+        );
+        assert_eq!(BASE_POINT.mul_scalar(scalar), product);
+        assert_eq!(BASE_POINT.mul_scalar(BigInt::ZERO), AffinePoint::IDENTITY);
+        let order = BigInt::new([
+            0xffffffff00000000,
+            0xffffffffffffffff,
+            0xbce6faada7179e84,
+            0xf3b9cac2fc632551,
+        ]);
+        assert_eq!(BASE_POINT.mul_scalar(order), AffinePoint::IDENTITY);
+        let order_plus_one = order + BigInt::from(1);
+        assert_eq!(BASE_POINT.mul_scalar(order_plus_one), BASE_POINT);
+    }
+
+    #[test]
+    fn batch_conversion() {
+        let points = [
+            BASE_POINT.as_jacobian(),
+            BASE_POINT.as_jacobian().double(),
+            JacobianPoint::IDENTITY,
+            BASE_POINT.as_jacobian().double().add_affine(BASE_POINT),
+        ];
+        let affine = batch_to_affine(&points);
+        assert_eq!(affine[2], AffinePoint::IDENTITY);
+        for (point, affine) in points.into_iter().zip(affine) {
+            assert_eq!(point.as_affine(), affine);
+        }
+    }
+
+    #[test]
+    fn mul_base_matches_mul_scalar() {
+        let scalars = [
+            BigInt::from(1),
+            BigInt::from(0x0123456789abcdef),
+            BigInt::new([
+                0x0123456789abcdef,
+                0xfedcba9876543210,
+                0x0f1e2d3c4b5a6978,
+                0x8796a5b4c3d2e1f0,
+            ]),
+            BigInt::new([u64::MAX; 4]),
+        ];
+        for scalar in scalars {
+            assert_eq!(mul_base(scalar), BASE_POINT.mul_scalar(scalar));
+        }
+        assert_eq!(mul_base(BigInt::ZERO), AffinePoint::IDENTITY);
     }
 }